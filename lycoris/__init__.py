@@ -1,11 +1,4 @@
-try:
-    from . import kohya
-except Exception:
-    pass
-from . import (
-    modules,
-    utils,
-)
+import importlib
 
 from .config_sdk import (
     PresetConfig,
@@ -14,22 +7,84 @@ from .config_sdk import (
     list_algorithms,
     PresetValidationError,
 )
-from .config import list_builtin_presets
-
-from .modules.locon import LoConModule
-from .modules.loha import LohaModule
-from .modules.lokr import LokrModule
-from .modules.dylora import DyLoraModule
-from .modules.glora import GLoRAModule
-from .modules.norms import NormModule
-from .modules.full import FullModule
-from .modules.diag_oft import DiagOFTModule
-from .modules import make_module
-
-from .wrapper import (
-    LycorisNetwork,
-    create_lycoris,
-    create_lycoris_from_weights,
+from .config import (
+    list_builtin_presets,
+    copy_builtin_presets,
+    builtin_preset_dict,
+    presets_targeting,
 )
 
 from .logging import logger
+
+
+# Everything below pulls in torch, so it is only imported on first access
+# (PEP 562). Config-only consumers never pay for it.
+_LAZY_SUBMODULES = ("kohya", "modules", "utils", "wrapper")
+_LAZY_ATTRS = {
+    "LoConModule": (".modules.locon", "LoConModule"),
+    "LohaModule": (".modules.loha", "LohaModule"),
+    "LokrModule": (".modules.lokr", "LokrModule"),
+    "DyLoraModule": (".modules.dylora", "DyLoraModule"),
+    "GLoRAModule": (".modules.glora", "GLoRAModule"),
+    "NormModule": (".modules.norms", "NormModule"),
+    "FullModule": (".modules.full", "FullModule"),
+    "DiagOFTModule": (".modules.diag_oft", "DiagOFTModule"),
+    "make_module": (".modules", "make_module"),
+    "LycorisNetwork": (".wrapper", "LycorisNetwork"),
+    "create_lycoris": (".wrapper", "create_lycoris"),
+    "create_lycoris_from_weights": (".wrapper", "create_lycoris_from_weights"),
+}
+
+
+__all__ = [
+    "PresetConfig",
+    "AlgoOverride",
+    "describe_algo",
+    "list_algorithms",
+    "PresetValidationError",
+    "list_builtin_presets",
+    "copy_builtin_presets",
+    "builtin_preset_dict",
+    "presets_targeting",
+    "logger",
+    "modules",
+    "utils",
+    "wrapper",
+    *_LAZY_ATTRS,
+]
+
+
+_kohya_import_error = None
+
+
+def __getattr__(name):
+    global _kohya_import_error
+    if name == "kohya" and _kohya_import_error is not None:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from _kohya_import_error
+
+    if name in _LAZY_SUBMODULES:
+        try:
+            value = importlib.import_module(f".{name}", __name__)
+        except ModuleNotFoundError as e:
+            # A missing lycoris.* module is a bug, not a missing dependency.
+            if name != "kohya" or (e.name or "").startswith("lycoris"):
+                raise
+            # kohya is optional, only skip it when its dependencies are missing.
+            _kohya_import_error = e
+            logger.warning(f"lycoris.kohya is unavailable: {e}")
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}"
+            ) from e
+    elif name in _LAZY_ATTRS:
+        module_name, attr = _LAZY_ATTRS[name]
+        value = getattr(importlib.import_module(module_name, __name__), attr)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_SUBMODULES) | set(_LAZY_ATTRS))
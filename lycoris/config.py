@@ -1,13 +1,15 @@
 from __future__ import annotations
 
-from .config_sdk import PresetConfig, AlgoOverride
+import functools
+import sys
+from types import MappingProxyType
+from typing import Any, Iterator, Mapping
 
+from .config_sdk import PresetConfig, AlgoOverride, TARGET_LIST_KEYS
 
-FULL_UNET_MODULES = [
-    "Transformer2DModel",
-    "ResnetBlock2D",
-    "Downsample2D",
-    "Upsample2D",
+
+# Transformer/DiT block classes shared by every preset that targets attention/MLP.
+DIT_BLOCK_MODULES: tuple[str, ...] = (
     "HunYuanDiTBlock",  # HunYuanDiT
     "DoubleStreamBlock",  # Flux
     "SingleStreamBlock",  # Flux
@@ -21,10 +23,21 @@ FULL_UNET_MODULES = [
     "FinalLayer",  # lumina-image-2
     "QwenImageTransformerBlock",  # Qwen
     "ZImageTransformerBlock",
-    "AceStepEncoderLayer", 
+    "AceStepEncoderLayer",
     "AceStepDiTLayer",
+)
+DIT_BLOCK_MODULE_SET: frozenset[str] = frozenset(DIT_BLOCK_MODULES)
+
+FULL_UNET_MODULES = [
+    "Transformer2DModel",
+    "ResnetBlock2D",
+    "Downsample2D",
+    "Upsample2D",
+    *DIT_BLOCK_MODULES,
 ]
 
+TRANSFORMER_UNET_MODULES = ["Transformer2DModel", *DIT_BLOCK_MODULES]
+
 FULL_UNET_NAMES = [
     "conv_in",
     "conv_out",
@@ -58,21 +71,7 @@ BUILTIN_PRESET_CONFIGS = {
         unet_target_module=[
             "Transformer2DModel",
             "ResnetBlock2D",
-            "HunYuanDiTBlock",
-            "DoubleStreamBlock",
-            "SingleStreamBlock",
-            "SingleDiTBlock",
-            "MMDoubleStreamBlock",  # HunYuanVideo
-            "MMSingleStreamBlock",  # HunYuanVideo
-            "WanAttentionBlock",  # Wan
-            "HunyuanVideoTransformerBlock",  # FramePack
-            "HunyuanVideoSingleTransformerBlock",  # FramePack
-            "JointTransformerBlock",  # lumina-image-2
-            "FinalLayer",  # lumina-image-2
-            "QwenImageTransformerBlock",  # Qwen
-            "ZImageTransformerBlock",
-            "AceStepEncoderLayer",
-            "AceStepDiTLayer",
+            *DIT_BLOCK_MODULES,
         ],
         unet_target_name=[
             "time_embedding.linear_1",
@@ -83,24 +82,7 @@ BUILTIN_PRESET_CONFIGS = {
     ),
     "attn-mlp": PresetConfig(
         enable_conv=False,
-        unet_target_module=[
-            "Transformer2DModel",
-            "HunYuanDiTBlock",
-            "DoubleStreamBlock",
-            "SingleStreamBlock",
-            "SingleDiTBlock",
-            "MMDoubleStreamBlock",  # HunYuanVideo
-            "MMSingleStreamBlock",  # HunYuanVideo
-            "WanAttentionBlock",  # Wan
-            "HunyuanVideoTransformerBlock",  # FramePack
-            "HunyuanVideoSingleTransformerBlock",  # FramePack
-            "JointTransformerBlock",  # lumina-image-2
-            "FinalLayer",  # lumina-image-2
-            "QwenImageTransformerBlock",  # Qwen
-            "ZImageTransformerBlock",
-            "AceStepEncoderLayer",
-            "AceStepDiTLayer",
-        ],
+        unet_target_module=TRANSFORMER_UNET_MODULES,
         unet_target_name=[],
         text_encoder_target_module=FULL_TEXT_ENCODER_MODULES,
         text_encoder_target_name=[],
@@ -132,24 +114,7 @@ BUILTIN_PRESET_CONFIGS = {
     ),
     "unet-transformer-only": PresetConfig(
         enable_conv=False,
-        unet_target_module=[
-            "Transformer2DModel",
-            "HunYuanDiTBlock",
-            "DoubleStreamBlock",
-            "SingleStreamBlock",
-            "SingleDiTBlock",
-            "MMDoubleStreamBlock",  # HunYuanVideo
-            "MMSingleStreamBlock",  # HunYuanVideo
-            "WanAttentionBlock",  # Wan
-            "HunyuanVideoTransformerBlock",  # FramePack
-            "HunyuanVideoSingleTransformerBlock",  # FramePack
-            "JointTransformerBlock",  # lumina-image-2
-            "FinalLayer",  # lumina-image-2
-            "QwenImageTransformerBlock",  # Qwen
-            "ZImageTransformerBlock",
-            "AceStepEncoderLayer",
-            "AceStepDiTLayer",
-        ],
+        unet_target_module=TRANSFORMER_UNET_MODULES,
         unet_target_name=[],
         text_encoder_target_module=[],
         text_encoder_target_name=[],
@@ -178,8 +143,95 @@ BUILTIN_PRESET_CONFIGS = {
 }
 
 
-PRESET = {name: cfg.to_dict() for name, cfg in BUILTIN_PRESET_CONFIGS.items()}
+def _intern_preset_names() -> None:
+    # Interned names let `in`/`==` checks against module class names (which
+    # CPython interns as well) short-circuit on identity. Lists are updated in
+    # place so presets keep sharing FULL_UNET_MODULES and friends.
+    for cfg in BUILTIN_PRESET_CONFIGS.values():
+        for key in TARGET_LIST_KEYS:
+            names = getattr(cfg, key)
+            if names:
+                names[:] = map(sys.intern, names)
+
+
+_intern_preset_names()
+
+
+def _build_module_index() -> dict[str, frozenset[str]]:
+    index: dict[str, set[str]] = {}
+    for preset_name, cfg in BUILTIN_PRESET_CONFIGS.items():
+        for key in TARGET_LIST_KEYS:
+            if key == "exclude_name":
+                continue
+            for target in cfg.target_set(key):
+                index.setdefault(target, set()).add(preset_name)
+    return {target: frozenset(names) for target, names in index.items()}
+
+
+# module class / layer name -> names of the builtin presets that target it
+_MODULE_TO_PRESETS: dict[str, frozenset[str]] = _build_module_index()
+
+
+def presets_targeting(module_class_name: str) -> frozenset[str]:
+    """Return the names of the builtin presets that target the given module
+    class or layer name."""
+    return _MODULE_TO_PRESETS.get(module_class_name, frozenset())
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, list):
+        return tuple(value)
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    return value
+
+
+@functools.lru_cache(maxsize=None)
+def _preset_dict(name: str) -> Mapping[str, Any]:
+    return _freeze(BUILTIN_PRESET_CONFIGS[name].to_dict())
+
+
+class _LazyPresetMapping(Mapping[str, Mapping[str, Any]]):
+    """Read-only view of the builtin presets, serialized on first access."""
+
+    def __getitem__(self, name: str) -> Mapping[str, Any]:
+        if name not in BUILTIN_PRESET_CONFIGS:
+            raise KeyError(name)
+        return _preset_dict(name)
+
+    def __contains__(self, name: object) -> bool:
+        return name in BUILTIN_PRESET_CONFIGS
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(BUILTIN_PRESET_CONFIGS)
+
+    def __len__(self) -> int:
+        return len(BUILTIN_PRESET_CONFIGS)
+
+
+PRESET: Mapping[str, Mapping[str, Any]] = _LazyPresetMapping()
+
+
+def list_builtin_presets() -> Mapping[str, PresetConfig]:
+    """Return a read-only view of the builtin presets.
+
+    The serialized form in ``PRESET`` is shared and immutable as well: nested
+    maps are ``MappingProxyType`` and module/name lists are tuples, so they
+    can't be deep-copied or JSON-encoded directly. Use
+    :func:`builtin_preset_dict` for a plain dict of one preset, or
+    :func:`copy_builtin_presets` for mutable ``PresetConfig`` objects.
+    """
+    return MappingProxyType(BUILTIN_PRESET_CONFIGS)
+
+
+def builtin_preset_dict(name: str) -> dict[str, Any]:
+    """Return a plain, mutable dict for the builtin preset ``name``."""
+    return BUILTIN_PRESET_CONFIGS[name].to_dict()
 
 
-def list_builtin_presets() -> dict[str, PresetConfig]:
-    return BUILTIN_PRESET_CONFIGS.copy()
+def copy_builtin_presets() -> dict[str, PresetConfig]:
+    """Return independent, mutable copies of the builtin presets."""
+    return {
+        name: PresetConfig.from_dict(cfg.to_dict())
+        for name, cfg in BUILTIN_PRESET_CONFIGS.items()
+    }
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Any, Dict, Iterable, Mapping, Optional
+from dataclasses import dataclass, field, fields
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional
 import copy
+import fnmatch
+import os
+import re
+import sys
 
 
 VALID_PRESET_KEYS: tuple[str, ...] = (
@@ -19,9 +24,20 @@ VALID_PRESET_KEYS: tuple[str, ...] = (
     "text_encoder_target_name",
     "exclude_name",
 )
+_VALID_PRESET_KEYS_SET: frozenset[str] = frozenset(VALID_PRESET_KEYS)
+_ALGO_MAP_KEYS: tuple[str, ...] = ("module_algo_map", "name_algo_map")
+TARGET_LIST_KEYS: tuple[str, ...] = (
+    "target_module",
+    "target_name",
+    "unet_target_module",
+    "unet_target_name",
+    "text_encoder_target_module",
+    "text_encoder_target_name",
+    "exclude_name",
+)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AlgoSpec:
     """Metadata that describes which arguments an algorithm understands."""
 
@@ -30,12 +46,17 @@ class AlgoSpec:
     supported_args: tuple[str, ...] = ()
     required_args: tuple[str, ...] = ()
     notes: Optional[str] = None
+    supported_args_set: frozenset[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "name", sys.intern(self.name))
+        object.__setattr__(self, "supported_args_set", frozenset(self.supported_args))
 
     def supports(self, arg: str) -> bool:
-        return arg in self.supported_args
+        return arg in self.supported_args_set
 
 
-ALGO_REGISTRY: Dict[str, AlgoSpec] = {
+_ALGO_SPECS: Dict[str, AlgoSpec] = {
     "lora": AlgoSpec(
         name="lora",
         description="Standard LoRA / LoCon adapter.",
@@ -155,12 +176,26 @@ ALGO_REGISTRY: Dict[str, AlgoSpec] = {
     ),
 }
 
+# The registry is fixed at import time and exposed read-only, which keeps the
+# precomputed _ALL_SPECS returned by list_algorithms() in sync with it.
+ALGO_REGISTRY: Mapping[str, AlgoSpec] = MappingProxyType(_ALGO_SPECS)
+_ALL_SPECS: tuple[AlgoSpec, ...] = tuple(ALGO_REGISTRY.values())
+
+
+def _lookup_algo(name: str) -> Optional[AlgoSpec]:
+    # Registry keys are lowercase and so are canonical names in preset files,
+    # only pay for .lower() when the exact lookup misses.
+    spec = ALGO_REGISTRY.get(name)
+    if spec is None:
+        spec = ALGO_REGISTRY.get(name.lower())
+    return spec
+
 
 class PresetValidationError(ValueError):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class AlgoOverride:
     """Per-module override describing which algorithm and kwargs to use."""
 
@@ -173,8 +208,32 @@ class AlgoOverride:
         algo = data.pop("algo", None)
         return cls(algo=algo, options=data)
 
+    @classmethod
+    def from_mapping_validated(
+        cls, mapping: Mapping[str, Any], spec: Optional[AlgoSpec]
+    ) -> "AlgoOverride":
+        """Same as ``from_mapping`` followed by ``validate``, in a single pass.
+
+        ``spec`` is the registry entry for ``mapping["algo"]`` (None if unknown).
+        """
+        algo = mapping.get("algo")
+        if algo is not None and spec is None:
+            raise PresetValidationError(f"Unknown algorithm '{algo}'.")
+        options: Dict[str, Any] = {}
+        for key, value in mapping.items():
+            if key == "algo":
+                continue
+            if spec is not None and key not in spec.supported_args_set:
+                raise PresetValidationError(
+                    f"Unsupported option '{key}' for algo '{algo}'. "
+                    f"Supported options: {spec.supported_args or 'None'}"
+                )
+            options[key] = value
+        return cls(algo=algo, options=options)
+
     def to_dict(self) -> Dict[str, Any]:
-        result = copy.deepcopy(self.options)
+        # Option values are scalars in practice, a shallow copy is enough.
+        result = dict(self.options)
         if self.algo is not None:
             result["algo"] = self.algo
         return result
@@ -182,27 +241,106 @@ class AlgoOverride:
     def validate(self) -> None:
         if self.algo is None:
             return
-        algo_name = self.algo.lower()
-        if algo_name not in ALGO_REGISTRY:
+        spec = _lookup_algo(self.algo)
+        if spec is None:
             raise PresetValidationError(f"Unknown algorithm '{self.algo}'.")
-        spec = ALGO_REGISTRY[algo_name]
-        for key in self.options.keys():
-            if key not in spec.supported_args:
-                # Allow unknown options for forward compatibility but warn via exception details.
-                raise PresetValidationError(
-                    f"Unsupported option '{key}' for algo '{self.algo}'. "
-                    f"Supported options: {spec.supported_args or 'None'}"
-                )
+        unsupported = self.options.keys() - spec.supported_args_set
+        if unsupported:
+            key = next(key for key in self.options if key in unsupported)
+            raise PresetValidationError(
+                f"Unsupported option '{key}' for algo '{self.algo}'. "
+                f"Supported options: {spec.supported_args or 'None'}"
+            )
+
+
+def _check_preset_keys(data: Mapping[str, Any]) -> None:
+    unknown_keys = data.keys() - _VALID_PRESET_KEYS_SET
+    if unknown_keys:
+        raise PresetValidationError(
+            f"Unknown preset keys: {', '.join(sorted(unknown_keys))}. "
+            f"Valid keys: {', '.join(VALID_PRESET_KEYS)}"
+        )
+
+
+_INLINE_GLOBAL_FLAGS = re.compile(r"\(\?[aiLmsux]+\)")
+
+
+def _never_match(name: str) -> bool:
+    return False
+
+
+def compile_name_matcher(
+    patterns: Iterable[str], use_fnmatch: bool = False
+) -> Callable[[str], bool]:
+    """Combine name patterns into a predicate that is true if any of them matches.
+
+    Uses the same rules as ``LycorisNetwork.match_fn``: ``fnmatch`` globs when
+    ``use_fnmatch`` is set, ``re.match`` regexes otherwise. The patterns are
+    joined into a single regex so a name is checked in one pass.
+    """
+    if use_fnmatch:
+        sources = [fnmatch.translate(os.path.normcase(p)) for p in patterns]
+    else:
+        sources = list(patterns)
+    if not sources:
+        return _never_match
+
+    compiled = [re.compile(source) for source in sources]
+    union = None
+    # Groups/backreferences would be renumbered in a union, and inline global
+    # flags like "(?i)" would apply to every pattern (Python 3.10 only warns);
+    # keep per-pattern matching for those.
+    if not any(regex.groups for regex in compiled) and not any(
+        _INLINE_GLOBAL_FLAGS.search(source) for source in sources
+    ):
+        try:
+            union = re.compile("|".join(f"(?:{source})" for source in sources))
+        except re.error:
+            pass
+
+    normcase = os.path.normcase if use_fnmatch else None
+
+    def matches(name: str) -> bool:
+        if normcase is not None:
+            name = normcase(name)
+        if union is not None:
+            return union.match(name) is not None
+        return any(regex.match(name) for regex in compiled)
+
+    return matches
 
 
 def _copy_value(value: Any) -> Any:
     if value is None:
         return None
+    if isinstance(value, list):
+        # Preset lists only hold module/layer names (immutable str).
+        return value.copy()
+    if isinstance(value, dict):
+        return {key: _copy_value(item) for key, item in value.items()}
     return copy.deepcopy(value)
 
 
-@dataclass
-class PresetConfig:
+class _PresetCaches:
+    """Lazily built lookup caches of ``PresetConfig``.
+
+    Kept as plain slots outside the dataclass fields so that ``asdict``,
+    ``fields`` and comparisons never see them; copies and pickles carry only the
+    fields and start with empty caches.
+    """
+
+    __slots__ = ("_target_sets", "_name_matchers")
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+    def __setstate__(self, state: Mapping[str, Any]) -> None:
+        for key, value in state.items():
+            object.__setattr__(self, key, value)
+
+
+@dataclass(slots=True)
+class PresetConfig(_PresetCaches):
     enable_conv: Optional[bool] = None
     target_module: Optional[list[str]] = None
     target_name: Optional[list[str]] = None
@@ -217,29 +355,41 @@ class PresetConfig:
     exclude_name: Optional[list[str]] = None
     extra: Dict[str, Any] = field(default_factory=dict)
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        # Reassigning a list field drops its cached target_set/matcher.
+        if name in TARGET_LIST_KEYS:
+            target_sets = getattr(self, "_target_sets", None)
+            if target_sets:
+                target_sets.pop(name, None)
+            name_matchers = getattr(self, "_name_matchers", None)
+            if name_matchers:
+                name_matchers.pop(name, None)
+        elif name == "use_fnmatch" and getattr(self, "_name_matchers", None):
+            self._name_matchers = None
+
     @classmethod
     def from_dict(
         cls, data: Mapping[str, Any], *, strict: bool = False
     ) -> "PresetConfig":
-        unknown_keys = [key for key in data.keys() if key not in VALID_PRESET_KEYS]
-        if unknown_keys:
-            raise PresetValidationError(
-                f"Unknown preset keys: {', '.join(sorted(unknown_keys))}. "
-                f"Valid keys: {', '.join(VALID_PRESET_KEYS)}"
-            )
+        _check_preset_keys(data)
 
         kwargs: Dict[str, Any] = {}
         extra: Dict[str, Any] = {}
-        for key in VALID_PRESET_KEYS:
-            if key not in data:
-                continue
-            if key in ("module_algo_map", "name_algo_map"):
+        for key in _VALID_PRESET_KEYS_SET & data.keys():
+            if key in _ALGO_MAP_KEYS:
                 overrides = {}
                 raw_map = data.get(key) or {}
                 for override_key, override_value in raw_map.items():
-                    override = AlgoOverride.from_mapping(override_value or {})
+                    override_value = override_value or {}
                     if strict:
-                        override.validate()
+                        algo = override_value.get("algo")
+                        spec = None if algo is None else _lookup_algo(algo)
+                        override = AlgoOverride.from_mapping_validated(
+                            override_value, spec
+                        )
+                    else:
+                        override = AlgoOverride.from_mapping(override_value)
                     overrides[override_key] = override
                 kwargs[key] = overrides
             else:
@@ -248,17 +398,28 @@ class PresetConfig:
         preset.extra = extra
         return preset
 
-    def to_dict(self) -> Dict[str, Any]:
-        data: Dict[str, Any] = {}
-
-        def maybe_set(key: str, value: Any) -> None:
-            if value is None:
-                return
-            data[key] = _copy_value(value)
+    def validate(self) -> None:
+        for overrides in (self.module_algo_map, self.name_algo_map):
+            for override in overrides.values():
+                override.validate()
 
-        maybe_set("enable_conv", self.enable_conv)
-        maybe_set("target_module", self.target_module)
-        maybe_set("target_name", self.target_name)
+    def to_dict(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = {
+            key: _copy_value(value)
+            for key, value in (
+                ("enable_conv", self.enable_conv),
+                ("target_module", self.target_module),
+                ("target_name", self.target_name),
+                ("lora_prefix", self.lora_prefix),
+                ("use_fnmatch", self.use_fnmatch),
+                ("unet_target_module", self.unet_target_module),
+                ("unet_target_name", self.unet_target_name),
+                ("text_encoder_target_module", self.text_encoder_target_module),
+                ("text_encoder_target_name", self.text_encoder_target_name),
+                ("exclude_name", self.exclude_name),
+            )
+            if value is not None
+        }
         if self.module_algo_map:
             data["module_algo_map"] = {
                 key: override.to_dict()
@@ -268,32 +429,59 @@ class PresetConfig:
             data["name_algo_map"] = {
                 key: override.to_dict() for key, override in self.name_algo_map.items()
             }
-        maybe_set("lora_prefix", self.lora_prefix)
-        maybe_set("use_fnmatch", self.use_fnmatch)
-        maybe_set("unet_target_module", self.unet_target_module)
-        maybe_set("unet_target_name", self.unet_target_name)
-        maybe_set("text_encoder_target_module", self.text_encoder_target_module)
-        maybe_set("text_encoder_target_name", self.text_encoder_target_name)
-        maybe_set("exclude_name", self.exclude_name)
-
-        data.update(_copy_value(self.extra))
+
+        # extra may hold arbitrary user-supplied nested structures.
+        data.update(copy.deepcopy(self.extra))
         return data
 
-    def list_algorithms(self) -> Iterable[str]:
-        for override in self.module_algo_map.values():
-            if override.algo:
-                yield override.algo
-        for override in self.name_algo_map.values():
-            if override.algo:
-                yield override.algo
+    def target_set(self, key: str) -> frozenset[str]:
+        """Frozenset view of a list-valued field for O(1) membership tests.
+
+        Cached until the field is reassigned; in-place edits of the list are not
+        tracked, assign a new list instead.
+        """
+        if key not in TARGET_LIST_KEYS:
+            raise KeyError(key)
+        target_sets = getattr(self, "_target_sets", None)
+        if target_sets is None:
+            target_sets = self._target_sets = {}
+        cached = target_sets.get(key)
+        if cached is None:
+            cached = frozenset(getattr(self, key) or ())
+            target_sets[key] = cached
+        return cached
+
+    def matches_name(self, name: str, key: str = "target_name") -> bool:
+        """Whether ``name`` is listed in, or matched by a pattern of, field ``key``.
+
+        The patterns are compiled into a single matcher on first use (globs
+        when ``use_fnmatch`` is set, regexes otherwise) and rebuilt when the
+        field or ``use_fnmatch`` is reassigned.
+        """
+        name_matchers = getattr(self, "_name_matchers", None)
+        if name_matchers is None:
+            name_matchers = self._name_matchers = {}
+        matcher = name_matchers.get(key)
+        if matcher is None:
+            matcher = compile_name_matcher(self.target_set(key), bool(self.use_fnmatch))
+            name_matchers[key] = matcher
+        return name in self.target_set(key) or matcher(name)
+
+    def list_algorithms(self) -> tuple[str, ...]:
+        return tuple(
+            override.algo
+            for overrides in (self.module_algo_map, self.name_algo_map)
+            for override in overrides.values()
+            if override.algo
+        )
 
 
 def describe_algo(name: str) -> AlgoSpec:
-    algo_name = name.lower()
-    if algo_name not in ALGO_REGISTRY:
+    spec = _lookup_algo(name)
+    if spec is None:
         raise PresetValidationError(f"Unknown algorithm '{name}'.")
-    return ALGO_REGISTRY[algo_name]
+    return spec
 
 
-def list_algorithms() -> Iterable[AlgoSpec]:
-    return ALGO_REGISTRY.values()
+def list_algorithms() -> tuple[AlgoSpec, ...]:
+    return _ALL_SPECS
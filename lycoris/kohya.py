@@ -22,6 +22,7 @@ from .modules.boft import ButterflyOFTModule
 from .modules import make_module, get_module
 
 from .config import PRESET
+from .config_sdk import compile_name_matcher
 from .utils.preset import read_preset
 from .utils import str_bool
 from .logging import logger
@@ -467,11 +468,10 @@ class LycorisNetworkKohya(LycorisNetwork):
             # Track which targets were matched
             matched_modules = set()
             matched_names = set()
+            match_replace = compile_name_matcher(target_replace_names, self.USE_FNMATCH)
             for name, module in root_module.named_modules():
                 module_name = module.__class__.__name__
-                if module_name in target_replace_modules and not any(
-                    self.match_fn(t, name) for t in target_replace_names
-                ):
+                if module_name in target_replace_modules and not match_replace(name):
                     matched_modules.add(module_name)
                     if module_name in self.MODULE_ALGO_MAP:
                         next_config = self.MODULE_ALGO_MAP[module_name]
@@ -484,9 +484,7 @@ class LycorisNetworkKohya(LycorisNetwork):
                         ]
                     )
                     next_config = {}
-                elif name in target_replace_names or any(
-                    self.match_fn(t, name) for t in target_replace_names
-                ):
+                elif name in target_replace_names or match_replace(name):
                     # Track which pattern matched and the module class
                     matched_modules.add(module_name)
                     if name in target_replace_names:
@@ -1,18 +1,59 @@
-import toml
+import functools
+import os
 
-from ..config_sdk import PresetConfig, PresetValidationError
+try:
+    import tomllib
+except ImportError:
+    import tomli as tomllib
 
+from ..config_sdk import PresetConfig, PresetValidationError, _copy_value
 
-def read_preset(preset_path):
-    try:
-        raw_config = toml.load(preset_path)
-    except Exception as e:
-        print("Error: cannot read preset file. ", e)
-        return None
 
+def _serialize_preset(raw_config):
+    # Same result as PresetConfig.from_dict(raw_config).to_dict(), but the algo
+    # maps are copied as plain dicts instead of round-tripping every entry
+    # through AlgoOverride.
+    algo_maps = {
+        key: raw_config.pop(key)
+        for key in ("module_algo_map", "name_algo_map")
+        if key in raw_config
+    }
+    preset = PresetConfig.from_dict(raw_config).to_dict()
+    for key, raw_map in algo_maps.items():
+        if raw_map:
+            preset[key] = {name: dict(value or {}) for name, value in raw_map.items()}
+    return preset
+
+
+@functools.lru_cache(maxsize=64)
+def _read_preset_cached(preset_path, mtime_ns, size):
+    # mtime_ns and size are only part of the cache key, so edited files get re-read.
+    with open(preset_path, "rb") as f:
+        raw_config = tomllib.load(f)
+    return _serialize_preset(raw_config)
+
+
+def _read_preset_file(preset_file):
+    # Open file objects have no stable cache key, parse them every time.
+    content = preset_file.read()
+    if isinstance(content, bytes):
+        content = content.decode("utf-8")
+    return _serialize_preset(tomllib.loads(content))
+
+
+def read_preset(preset_path):
     try:
-        preset = PresetConfig.from_dict(raw_config)
+        if hasattr(preset_path, "read"):
+            return _read_preset_file(preset_path)
+        st = os.stat(preset_path)
+        preset = _read_preset_cached(
+            os.path.abspath(preset_path), st.st_mtime_ns, st.st_size
+        )
     except PresetValidationError as exc:
         print(f"Error: invalid preset content ({exc}).")
         return None
-    return preset.to_dict()
+    except (OSError, UnicodeDecodeError, tomllib.TOMLDecodeError) as e:
+        print("Error: cannot read preset file. ", e)
+        return None
+    # Callers own the returned dict, don't let them mutate the cached one.
+    return _copy_value(preset)
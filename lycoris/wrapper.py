@@ -21,7 +21,7 @@ from .modules.boft import ButterflyOFTModule
 from .modules import get_module, make_module
 
 from .config import PRESET
-from .config_sdk import VALID_PRESET_KEYS
+from .config_sdk import VALID_PRESET_KEYS, compile_name_matcher
 from .utils.preset import read_preset
 from .utils import str_bool
 from .logging import logger
@@ -408,16 +408,14 @@ class LycorisNetwork(torch.nn.Module):
             # Track which targets were matched
             matched_modules = set()
             matched_names = set()
+            match_exclude = compile_name_matcher(target_exclude_names, self.USE_FNMATCH)
+            match_replace = compile_name_matcher(target_replace_names, self.USE_FNMATCH)
             for name, module in root_module.named_modules():
-                if name in target_exclude_names or any(
-                    self.match_fn(t, name) for t in target_exclude_names
-                ):
+                if name in target_exclude_names or match_exclude(name):
                     continue
 
                 module_name = module.__class__.__name__
-                if module_name in target_replace_modules and not any(
-                    self.match_fn(t, name) for t in target_replace_names
-                ):
+                if module_name in target_replace_modules and not match_replace(name):
                     matched_modules.add(module_name)
                     if module_name in self.MODULE_ALGO_MAP:
                         next_config = self.MODULE_ALGO_MAP[module_name]
@@ -435,9 +433,7 @@ class LycorisNetwork(torch.nn.Module):
                     lora_map = {**lora_map, **_lora_map}
                     loras.extend(lora_lst)
                     next_config = {}
-                elif name in target_replace_names or any(
-                    self.match_fn(t, name) for t in target_replace_names
-                ):
+                elif name in target_replace_names or match_replace(name):
                     # Track which pattern matched and the module class
                     matched_modules.add(module_name)
                     if name in target_replace_names:
@@ -10,7 +10,7 @@ setup(
     author="Shih-Ying Yeh(KohakuBlueLeaf), Yu-Guan Hsieh, Zhidong Gao",
     author_email="kohaku@kblueleaf.net",
     zip_safe=False,
-    install_requires=["torch", "einops", "toml", "tqdm"],
+    install_requires=["torch", "einops", 'tomli; python_version < "3.11"', "tqdm"],
     python_requires=">=3.10",
     license="Apache-2.0",
     classifiers=[
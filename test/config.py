@@ -0,0 +1,223 @@
+import copy
+import dataclasses
+import json
+import os
+import pickle
+import tempfile
+import unittest
+
+try:
+    import tomllib
+except ImportError:
+    import tomli as tomllib
+
+from lycoris.config import (
+    BUILTIN_PRESET_CONFIGS,
+    PRESET,
+    builtin_preset_dict,
+    copy_builtin_presets,
+    presets_targeting,
+)
+from lycoris.config_sdk import (
+    ALGO_REGISTRY,
+    AlgoOverride,
+    AlgoSpec,
+    PresetConfig,
+    PresetValidationError,
+    list_algorithms,
+)
+from lycoris.utils.preset import read_preset
+
+
+class LycorisConfigTests(unittest.TestCase):
+    def test_copy_builtin_presets_is_independent(self):
+        presets = copy_builtin_presets()
+        presets["full"].unet_target_module.append("Foo")
+        presets["full"].enable_conv = False
+
+        self.assertNotIn("Foo", BUILTIN_PRESET_CONFIGS["full"].unet_target_module)
+        self.assertNotIn("Foo", BUILTIN_PRESET_CONFIGS["unet-only"].unet_target_module)
+        self.assertTrue(BUILTIN_PRESET_CONFIGS["full"].enable_conv)
+        self.assertTrue(PRESET["full"]["enable_conv"])
+        self.assertEqual(presets_targeting("Foo"), frozenset())
+
+    def test_builtin_preset_dict_is_plain_and_mutable(self):
+        for name in PRESET:
+            preset = builtin_preset_dict(name)
+            self.assertEqual(json.loads(json.dumps(preset)), preset)
+            self.assertEqual(copy.deepcopy(preset), preset)
+
+        preset = builtin_preset_dict("ia3")
+        preset["unet_target_name"].append("Foo")
+        preset["name_algo_map"]["mlp.fc2"]["train_on_input"] = False
+        self.assertNotIn("Foo", PRESET["ia3"]["unet_target_name"])
+        self.assertTrue(PRESET["ia3"]["name_algo_map"]["mlp.fc2"]["train_on_input"])
+
+    def test_presets_targeting(self):
+        self.assertGreaterEqual(
+            presets_targeting("Transformer2DModel"),
+            {"full", "attn-mlp", "unet-transformer-only"},
+        )
+        self.assertEqual(
+            presets_targeting("time_embedding.linear_1"),
+            {"full", "full-lin", "unet-only"},
+        )
+
+    def test_copies_do_not_share_lookup_caches(self):
+        preset = PresetConfig(target_name=["to_k"], exclude_name=["to_v"])
+        self.assertTrue(preset.matches_name("to_k"))
+        preset.target_set("exclude_name")
+
+        shallow = copy.copy(preset)
+        shallow.target_name = ["to_q"]
+        self.assertTrue(shallow.matches_name("to_q"))
+        self.assertTrue(preset.matches_name("to_k"))
+        self.assertFalse(preset.matches_name("to_q"))
+
+        for clone in (
+            copy.deepcopy(preset),
+            pickle.loads(pickle.dumps(preset)),
+            PresetConfig(**dataclasses.asdict(preset)),
+        ):
+            self.assertEqual(clone, preset)
+            self.assertTrue(clone.matches_name("to_k"))
+
+        for obj in (PresetConfig(), AlgoOverride(), BUILTIN_PRESET_CONFIGS["full"]):
+            self.assertEqual(copy.deepcopy(obj), obj)
+            self.assertEqual(pickle.loads(pickle.dumps(obj)), obj)
+
+    def test_strict_from_dict_rejects_unknown_algo(self):
+        data = {"module_algo_map": {"Attention": {"algo": "nope", "dim": 4}}}
+        with self.assertRaisesRegex(PresetValidationError, "Unknown algorithm 'nope'"):
+            PresetConfig.from_dict(data, strict=True)
+        PresetConfig.from_dict(data)
+
+    def test_strict_from_dict_names_first_unsupported_option(self):
+        data = {
+            "name_algo_map": {
+                "mlp.fc1": {"algo": "lora", "dim": 4, "factor": 2, "block_size": 1}
+            }
+        }
+        with self.assertRaisesRegex(
+            PresetValidationError, "Unsupported option 'factor' for algo 'lora'"
+        ):
+            PresetConfig.from_dict(data, strict=True)
+
+    def test_strict_from_dict_accepts_mixed_case_algo(self):
+        data = {"module_algo_map": {"Attention": {"algo": "LoKr", "factor": 4}}}
+        preset = PresetConfig.from_dict(data, strict=True)
+        self.assertEqual(
+            preset.module_algo_map["Attention"], AlgoOverride("LoKr", {"factor": 4})
+        )
+
+    def test_strict_from_dict_passes_through_overrides_without_algo(self):
+        data = {"module_algo_map": {"Attention": {"anything": 1}, "FeedForward": {}}}
+        preset = PresetConfig.from_dict(data, strict=True)
+        self.assertEqual(preset, PresetConfig.from_dict(data))
+        self.assertEqual(
+            preset.module_algo_map["Attention"], AlgoOverride(None, {"anything": 1})
+        )
+
+    def test_algo_registry_is_read_only(self):
+        with self.assertRaises(TypeError):
+            ALGO_REGISTRY["custom"] = AlgoSpec(name="custom", description="")
+        self.assertEqual(list_algorithms(), tuple(ALGO_REGISTRY.values()))
+
+    def test_target_set_follows_reassignment(self):
+        preset = PresetConfig(unet_target_module=["Transformer2DModel"])
+        self.assertEqual(
+            preset.target_set("unet_target_module"), {"Transformer2DModel"}
+        )
+        preset.unet_target_module = ["ResnetBlock2D"]
+        self.assertEqual(preset.target_set("unet_target_module"), {"ResnetBlock2D"})
+
+    def test_matches_name_follows_reassignment(self):
+        preset = PresetConfig(target_name=["attn?.to_k"], use_fnmatch=True)
+        self.assertTrue(preset.matches_name("attn1.to_k"))
+        preset.use_fnmatch = False
+        self.assertFalse(preset.matches_name("attn1.to_k"))
+        preset.target_name = [r".*\.to_v"]
+        self.assertTrue(preset.matches_name("attn1.to_v"))
+        self.assertFalse(preset.matches_name("attn1.to_k"))
+
+    def test_preset_pickles_after_matches_name(self):
+        preset = PresetConfig(
+            target_name=["attn?.to_k"], exclude_name=["*.to_v"], use_fnmatch=True
+        )
+        self.assertTrue(preset.matches_name("attn1.to_k"))
+        self.assertTrue(preset.matches_name("attn1.to_v", "exclude_name"))
+
+        restored = pickle.loads(pickle.dumps(preset))
+        self.assertEqual(restored, preset)
+        self.assertTrue(restored.matches_name("attn2.to_k"))
+        self.assertFalse(restored.matches_name("attn2.to_k", "exclude_name"))
+
+    def test_list_algorithms_follows_map_changes(self):
+        preset = PresetConfig()
+        self.assertEqual(preset.list_algorithms(), ())
+        preset.module_algo_map = {"Attention": AlgoOverride("lokr")}
+        self.assertEqual(preset.list_algorithms(), ("lokr",))
+        preset.module_algo_map["FeedForward"] = AlgoOverride("loha")
+        self.assertEqual(preset.list_algorithms(), ("lokr", "loha"))
+
+    def write_preset(self, content):
+        fd, path = tempfile.mkstemp(suffix=".toml")
+        with os.fdopen(fd, "w") as f:
+            f.write(content)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def test_read_preset_returns_fresh_dict(self):
+        path = self.write_preset(
+            'enable_conv = true\nunet_target_module = ["Transformer2DModel"]\n'
+        )
+        first = read_preset(path)
+        first["enable_conv"] = "POISON"
+        first["unet_target_module"].append("Foo")
+
+        second = read_preset(path)
+        self.assertIsNot(first, second)
+        self.assertEqual(
+            second,
+            {"enable_conv": True, "unet_target_module": ["Transformer2DModel"]},
+        )
+
+    def test_read_preset_matches_preset_config(self):
+        path = self.write_preset(
+            "enable_conv = true\n"
+            '[module_algo_map.Attention]\nalgo = "lokr"\nfactor = 4\n'
+            "[module_algo_map.FeedForward]\n"
+            '[name_algo_map."mlp.fc2"]\ndim = 8\n'
+        )
+        with open(path, "rb") as f:
+            expected = PresetConfig.from_dict(tomllib.load(f)).to_dict()
+        self.assertEqual(read_preset(path), expected)
+
+    def test_read_preset_sees_file_edits(self):
+        path = self.write_preset("enable_conv = true\n")
+        self.assertEqual(read_preset(path), {"enable_conv": True})
+
+        with open(path, "w") as f:
+            f.write('enable_conv = false\ntarget_name = ["to_k"]\n')
+        self.assertEqual(
+            read_preset(path), {"enable_conv": False, "target_name": ["to_k"]}
+        )
+
+    def test_read_preset_accepts_file_objects(self):
+        content = 'enable_conv = true\n[module_algo_map.Attention]\nalgo = "lokr"\n'
+        path = self.write_preset(content)
+        expected = read_preset(path)
+        with open(path) as f:
+            self.assertEqual(read_preset(f), expected)
+        with open(path, "rb") as f:
+            self.assertEqual(read_preset(f), expected)
+
+    def test_read_preset_returns_none_on_read_errors(self):
+        self.assertIsNone(read_preset(self.write_preset("enable_conv = \n")))
+        self.assertIsNone(read_preset(self.write_preset("unknown_key = 1\n")))
+        self.assertIsNone(read_preset(os.path.join(tempfile.gettempdir(), "lycoris-missing-preset.toml")))
+
+    def test_read_preset_propagates_malformed_algo_maps(self):
+        path = self.write_preset('module_algo_map = "lokr"\n')
+        with self.assertRaises(AttributeError):
+            read_preset(path)
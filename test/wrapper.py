@@ -2,6 +2,7 @@ import unittest
 import re
 
 from itertools import product
+from types import SimpleNamespace
 from parameterized import parameterized
 
 import torch
@@ -10,6 +11,7 @@ import torch.nn as nn
 from diffusers import FluxTransformer2DModel
 
 from lycoris import create_lycoris, create_lycoris_from_weights, LycorisNetwork
+from lycoris.config_sdk import compile_name_matcher
 
 
 def reset_globals():
@@ -92,6 +94,29 @@ if torch.backends.mps.is_available():
     device_and_dtype.append((torch.device("mps"), torch.float32))
 
 
+matcher_names = [
+    "conv_in",
+    "down_blocks.0.attentions.0.transformer_blocks.0.attn1.to_k",
+    "down_blocks.0.attentions.0.transformer_blocks.0.ATTN1.to_v",
+    "mid_block.resnets.1.conv1",
+    "text_model.encoder.layers.11.mlp.fc2",
+    "ff.net.2",
+    "a[1]",
+    "Down_sample.conv",
+]
+matcher_pattern_list = [
+    (False, []),
+    (False, ["conv_in"]),
+    (False, [r".*attn1\.to_k", r"ff\.net", "mid_block"]),
+    (False, [r"down_blocks\.(\d)\.attentions\.\1", r".*mlp\.(fc1|fc2)"]),
+    (False, ["down", "(?i).*attn1"]),
+    (True, []),
+    (True, ["*attn1*", "conv_?n"]),
+    (True, ["*.mlp.*", "*.[0-9].to_[kv]", "a[1]"]),
+    (True, ["*blocks*attentions*to_*"]),
+]
+
+
 patch_forward_param_list = list(
     product(
         algos,
@@ -286,6 +311,16 @@ class LycorisWrapperTests(unittest.TestCase):
         finally:
             reset_globals()
 
+    @parameterized.expand(matcher_pattern_list)
+    def test_compiled_name_matcher_agrees_with_match_fn(self, use_fnmatch, patterns):
+        network = SimpleNamespace(USE_FNMATCH=use_fnmatch)
+        matcher = compile_name_matcher(patterns, use_fnmatch)
+        for name in matcher_names:
+            expected = any(
+                LycorisNetwork.match_fn(network, pattern, name) for pattern in patterns
+            )
+            self.assertEqual(matcher(name), expected, (patterns, name))
+
     def test_lycoris_wrapper_regex_named_modules(
         self,
         device_dtype=(torch.device("cpu"), torch.float32),
@@ -13,6 +13,7 @@ from test.module import LycorisModuleTests
 from test.wrapper import LycorisWrapperTests
 from test.functional import LycorisFunctionalTests
 from test.kohya import LycorisKohyaWrapperTests
+from test.config import LycorisConfigTests
 
 
 TESTS = [
@@ -20,6 +21,7 @@ TESTS = [
     LycorisFunctionalTests,
     LycorisWrapperTests,
     LycorisKohyaWrapperTests,
+    LycorisConfigTests,
 ]
 
 